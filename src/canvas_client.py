@@ -1,13 +1,19 @@
 import asyncio
 import logging
+import re
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Any
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union, Any
 
 import aiohttp
 
 from config import Config
 
+_LOGGER = logging.getLogger(__name__)
+# Matches the 'next' relation in a Canvas pagination Link header
+_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
+
 class CanvasClientError(Exception):
     """Base exception for Canvas client errors."""
     pass
@@ -22,6 +28,10 @@ class CanvasAPIError(CanvasClientError):
 
 
 class CanvasClient:
+    # Module item type -> name of the method that fetches its content; resolved
+    # per call so instances don't hold bound-method reference cycles
+    _ITEM_HANDLERS: Dict[str, str] = {'Page': '_handle_page', 'File': '_handle_file'}
+
     def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         """Initialize the Canvas API client with configuration.
         
@@ -33,7 +43,7 @@ class CanvasClient:
         self.headers = {'Authorization': f'Bearer {self.api_token}'}
         self._session = session
         self._should_close_session = session is None
-        self.logger = logging.getLogger(__name__)
+        self.logger = _LOGGER
         
         # Validate configuration
         if not self.api_url or not self.api_token:
@@ -82,6 +92,42 @@ class CanvasClient:
             self.logger.error(error_msg)
             raise CanvasAPIError(error_msg, 0, endpoint)
             
+    async def _fetch_page(self, session: aiohttp.ClientSession, url: str) -> Tuple[Any, Optional[str]]:
+        """Fetch a single page of a paginated Canvas API endpoint.
+
+        Args:
+            session: The active aiohttp client session.
+            url: The absolute URL of the page to request.
+
+        Returns:
+            A tuple of the decoded JSON body and the URL of the next page,
+            or None if the Link header has no 'next' relation.
+
+        Raises:
+            CanvasAPIError: For non-200 responses and network errors
+        """
+        self.logger.debug(f"Fetching paginated data from: {url}")
+        try:
+            async with session.get(url, headers=self.headers) as response:
+                if response.status != 200:
+                    error_msg = f"Failed to fetch paginated data from {url}: {response.status}"
+                    self.logger.error(error_msg)
+                    raise CanvasAPIError(error_msg, response.status, url)
+
+                data = await response.json()
+
+                # Find the 'next' link in the Link header
+                next_link = None
+                link_header = response.headers.get('Link')
+                if link_header and (match := _LINK_RE.search(link_header)):
+                    next_link = match.group(1)
+                return data, next_link
+
+        except aiohttp.ClientError as e:
+            error_msg = f"Network error fetching paginated data from {url}: {str(e)}"
+            self.logger.error(error_msg)
+            raise CanvasAPIError(error_msg, 0, url)
+
     async def _get_paginated(self, session: aiohttp.ClientSession, endpoint: str) -> List[Dict[str, Any]]:
         """
         Retrieves all items from a paginated Canvas API endpoint.
@@ -97,41 +143,16 @@ class CanvasClient:
         url = f"{self.api_url}{endpoint}"
 
         while url:
-            self.logger.debug(f"Fetching paginated data from: {url}")
-            try:
-                async with session.get(url, headers=self.headers) as response:
-                    if response.status != 200:
-                        error_msg = f"Failed to fetch paginated data from {url}: {response.status}"
-                        self.logger.error(error_msg)
-                        raise CanvasAPIError(error_msg, response.status, url)
-
-                    data = await response.json()
-                    if isinstance(data, list):
-                        all_results.extend(data)
-                    else:
-                        # Handle cases where a non-list is returned unexpectedly
-                        self.logger.warning(f"Expected a list from {url}, but got {type(data)}. Stopping pagination.")
-                        if not all_results: # If this was the first and only page
-                            return data
-                        break
-
-                    # Find the 'next' link in the Link header
-                    next_link = None
-                    link_header = response.headers.get('Link')
-                    if link_header:
-                        links = link_header.split(',')
-                        for link in links:
-                            parts = link.split(';')
-                            if len(parts) == 2 and parts[1].strip() == 'rel="next"':
-                                # Extract URL from <...>
-                                next_link = parts[0].strip()[1:-1]
-                                break
-                    url = next_link # Continue loop with the next URL, or exit if None
-            
-            except aiohttp.ClientError as e:
-                error_msg = f"Network error fetching paginated data from {url}: {str(e)}"
-                self.logger.error(error_msg)
-                raise CanvasAPIError(error_msg, 0, url)
+            data, next_link = await self._fetch_page(session, url)
+            if isinstance(data, list):
+                all_results.extend(data)
+            else:
+                # Handle cases where a non-list is returned unexpectedly
+                self.logger.warning(f"Expected a list from {url}, but got {type(data)}. Stopping pagination.")
+                if not all_results: # If this was the first and only page
+                    return data
+                break
+            url = next_link # Continue loop with the next URL, or exit if None
 
         self.logger.info(f"Fetched a total of {len(all_results)} items from endpoint: {endpoint}")
         return all_results
@@ -291,30 +312,54 @@ class CanvasClient:
                 return f"File with encoding issues: {filename}"
         return None
 
-    async def fetch_module_item_content(self, session: aiohttp.ClientSession, course_id: int, module_item: Dict[str, Any]) -> Optional[str]:
+    async def _handle_page(self, session: aiohttp.ClientSession, course_id: int, module_item: Dict[str, Any]) -> Optional[str]:
+        """Fetch the content of a Page module item."""
+        page_url = module_item.get("page_url")
+        if not page_url:
+            self.logger.debug("Missing page_url for Page module item")
+            return None
+        return await self.get_page_content(session, course_id, page_url)
+
+    async def _handle_file(self, session: aiohttp.ClientSession, course_id: int, module_item: Dict[str, Any]) -> Optional[str]:
+        """Fetch the content of a File module item."""
+        content_id = module_item.get("content_id")
+        if not content_id:
+            self.logger.debug("Missing content_id for File module item")
+            return None
+        return await self.get_file_content(session, content_id)
+
+    async def fetch_module_item_content(
+        self,
+        session: aiohttp.ClientSession,
+        course_id: int,
+        module_item: Dict[str, Any],
+        handlers: Optional[Dict[str, Callable[..., Awaitable[Optional[str]]]]] = None,
+    ) -> Optional[str]:
         """Fetch the content of a module item based on its type.
         
         Args:
             session: The active client session
             course_id: The Canvas course ID
             module_item: The module item information
+            handlers: Optional mapping of item type to an async handler called as
+                ``handler(session, course_id, module_item)``. Defaults to the
+                client's Page and File handlers.
             
         Returns:
             The content of the module item if available, None otherwise
         """
         item_type = module_item.get("type")
-        
-        if item_type == "Page":
-            page_url = module_item.get("page_url")
-            if page_url:
-                return await self.get_page_content(session, course_id, page_url)
-        elif item_type == "File":
-            content_id = module_item.get("content_id")
-            if content_id:
-                return await self.get_file_content(session, content_id)
-        
-        self.logger.debug(f"Unsupported or missing content for item type: {item_type}")
-        return None
+        handler = None
+        if isinstance(item_type, str):
+            if handlers is None:
+                handler_name = self._ITEM_HANDLERS.get(item_type)
+                handler = getattr(self, handler_name) if handler_name else None
+            else:
+                handler = handlers.get(item_type)
+        if handler is None:
+            self.logger.debug(f"Unsupported content for item type: {item_type}")
+            return None
+        return await handler(session, course_id, module_item)
 
     def _html_to_text(self, html_content: Optional[str]) -> str:
         """Convert HTML content to plain text.
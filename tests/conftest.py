@@ -1,6 +1,70 @@
+import contextlib
+import functools
+from types import SimpleNamespace
 import pytest
 import os
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
+
+
+@contextlib.contextmanager
+def stub(obj, attr, return_value=None, **kwargs):
+    """Temporarily replace an async attribute with an AsyncMock.
+
+    Cheaper than ``patch.object`` for the common case of stubbing a client
+    coroutine; the original attribute is restored on exit.
+    """
+    had_own = attr in vars(obj)
+    original = vars(obj).get(attr)
+    mock = AsyncMock(return_value=return_value, **kwargs)
+    setattr(obj, attr, mock)
+    try:
+        yield mock
+    finally:
+        if had_own:
+            setattr(obj, attr, original)
+        else:
+            delattr(obj, attr)
+
+def aresp(status=200, json_data=None, text=None, read=None, link=None):
+    """Build a lightweight read-only aiohttp response stand-in.
+
+    ``text`` may be an exception instance, in which case ``await resp.text()``
+    raises it. ``link`` is returned for any ``resp.headers.get(...)`` lookup.
+    """
+    async def _json():
+        return json_data
+
+    async def _text():
+        if isinstance(text, BaseException):
+            raise text
+        return text
+
+    async def _read():
+        return read
+
+    headers = SimpleNamespace(get=lambda key, default=None: link)
+    return SimpleNamespace(status=status, json=_json, text=_text, read=_read, headers=headers)
+
+class FakeCtx:
+    """Async context manager yielding a preset response."""
+    __slots__ = ('response',)
+
+    def __init__(self, response):
+        self.response = response
+
+    async def __aenter__(self):
+        return self.response
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+class FakeSession:
+    """Minimal stand-in for aiohttp.ClientSession exposing only ``get``."""
+    __slots__ = ('get',)
+
+def pytest_configure(config):
+    """Register custom markers used across the suite."""
+    config.addinivalue_line("markers", "integration: mark test as integration test")
 
 @pytest.fixture(autouse=True)
 def mock_env_vars():
@@ -26,4 +90,53 @@ def sample_module_data():
         "id": 67890,
         "name": "Test Module",
         "position": 1
-    }
\ No newline at end of file
+    }
+
+@functools.lru_cache(maxsize=1)
+def _session_spec_names():
+    """Attribute names of aiohttp.ClientSession, walked once per process.
+
+    Passing the names rather than the class as ``spec`` skips the per-mock
+    ``dir()``/coroutine scan; attributes still resolve to sync MagicMocks.
+    """
+    import aiohttp
+    return tuple(dir(aiohttp.ClientSession))
+
+@pytest.fixture(scope="session")
+def _session_spec():
+    """Spec for session mocks, resolved once per test session."""
+    return _session_spec_names()
+
+@pytest.fixture
+def mock_session(_session_spec):
+    """Mock aiohttp session whose ``get`` behaves like ClientSession.get.
+
+    ``spec_set`` locks the attribute set down to ClientSession's, so typos
+    in tests fail loudly instead of growing the mock graph.
+    """
+    return AsyncMock(spec_set=_session_spec)
+
+@pytest.fixture
+def aio():
+    """Intercept aiohttp requests; register URL -> payload mappings on the yielded mocker."""
+    from aioresponses import aioresponses
+    with aioresponses() as m:
+        yield m
+
+def _async_fixture(func):
+    """Register an async fixture with pytest-asyncio when it is installed.
+
+    Keeps this conftest importable for suites that run without the async stack.
+    """
+    try:
+        import pytest_asyncio
+    except ImportError:
+        return pytest.fixture(func)
+    return pytest_asyncio.fixture(func)
+
+@_async_fixture
+async def real_session():
+    """Real aiohttp session, intended to be used together with the ``aio`` fixture."""
+    import aiohttp
+    async with aiohttp.ClientSession() as session:
+        yield session
@@ -3,8 +3,15 @@
 Standalone Docker Integration Test
 Tests all imports, core functionality without requiring pytest.
 Designed to run in any Python environment for troubleshooting.
+
+The checks are plain module-level functions, so pytest (and pytest-xdist,
+``pytest -n auto``) can collect them too; ``main()`` runs them serially.
 """
 
+import functools
+import importlib
+import importlib.util
+import itertools
 import os
 import sys
 import json
@@ -15,14 +22,352 @@ from pathlib import Path
 from datetime import datetime
 import logging
 
+try:
+    import pytest
+    _Skipped = pytest.skip.Exception
+except ImportError:
+    class _Skipped(Exception):
+        """Raised by the stand-in importorskip when a module is missing."""
+
+    # Minimal stand-in so the module imports and main() runs without pytest
+    class pytest:
+        @staticmethod
+        def fixture(func=None, **kwargs):
+            return func or (lambda f: f)
+
+        @staticmethod
+        def importorskip(modname, reason=None):
+            if importlib.util.find_spec(modname) is None:
+                raise _Skipped(reason or f"could not import {modname!r}")
+            return importlib.import_module(modname)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 # Add project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
+@functools.lru_cache(maxsize=1)
+def _project_root():
+    """Resolve the repository root once."""
+    return Path(__file__).parent.parent
+
+
+for _path in (str(_project_root()), str(_project_root() / "src")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+REQUIRED_IMPORTS = {
+    'json': 'standard library',
+    'os': 'standard library',
+    'sys': 'standard library',
+    'pathlib': 'standard library',
+    'tempfile': 'standard library',
+    'subprocess': 'standard library',
+}
+OPTIONAL_IMPORTS = {
+    'yaml': 'PyYAML',
+    'requests': 'requests library',
+}
+
+# Probe every module once at import time; the checks branch on the results
+IMPORT_PROBES = {
+    name: importlib.util.find_spec(name) is not None
+    for name in (*REQUIRED_IMPORTS, *OPTIONAL_IMPORTS)
+}
+HAS_REQUESTS = IMPORT_PROBES['requests']
+
+# Unique payload suffixes for the I/O checks
+_seq = itertools.count()
+
+TEST_ENV = {
+    'CANVAS_API_TOKEN': 'test_token_12345',
+    'CANVAS_URL': 'https://canvas.test.edu/api/v1',
+    'SUPABASE_URL': 'https://test.supabase.co',
+    'SUPABASE_ANON_KEY': 'test_anon_key',
+    'PYTHONPATH': str(_project_root())
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _project_layout():
+    """List the project root and its top-level directories once.
+
+    Returns a frozenset of POSIX paths relative to the project root;
+    directories carry a trailing ``/``. The walk stops two levels down,
+    which covers every path the checks inspect without descending into
+    virtualenvs or data directories; hidden directories and
+    ``__pycache__`` are pruned.
+    """
+    root = _project_root()
+    layout = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '__pycache__']
+        rel = Path(dirpath).relative_to(root).as_posix()
+        prefix = '' if rel == '.' else f"{rel}/"
+        layout.update(f"{prefix}{d}/" for d in dirnames)
+        layout.update(f"{prefix}{f}" for f in filenames)
+        if prefix:
+            dirnames[:] = []
+    return frozenset(layout)
+
+
+@pytest.fixture(scope="session")
+def project_layout():
+    """Cached snapshot of every path in the project tree."""
+    return _project_layout()
+
+
+@pytest.fixture(scope="session")
+def session_tmp(tmp_path_factory):
+    """One scratch directory shared by the I/O checks; use unique names inside it."""
+    return tmp_path_factory.mktemp("canvas_tests")
+
+
+def test_environment_setup():
+    """Test environment variable setup."""
+    # Set test environment variables
+    os.environ.update(TEST_ENV)
+    
+    # Validate required variables
+    required_vars = ['CANVAS_API_TOKEN', 'CANVAS_URL']
+    missing = [var for var in required_vars if not os.environ.get(var)]
+    if missing:
+        raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+    
+    logger.info("Environment variables configured successfully")
+
+
+def test_basic_imports():
+    """Test basic Python standard library imports."""
+    import json
+    import os
+    import sys
+    import tempfile
+    import subprocess
+    from pathlib import Path
+    from datetime import datetime
+    
+    # Test requests if available
+    if HAS_REQUESTS:
+        logger.info("Requests module available")
+    else:
+        logger.warning("Requests module not available")
+    
+    logger.info("Basic imports successful")
+
+
+def test_project_structure(project_layout):
+    """Test project directory structure."""
+    required_dirs = [
+        'src',
+        'scripts', 
+        'tests',
+        'docker',
+        'config'
+    ]
+    
+    for dir_name in required_dirs:
+        if f"{dir_name}/" not in project_layout:
+            if dir_name in project_layout:
+                raise NotADirectoryError(f"Path is not a directory: {dir_name}")
+            raise FileNotFoundError(f"Required directory missing: {dir_name}")
+    
+    logger.info("Project structure validation passed")
+
+
+def test_core_modules_exist(project_layout):
+    """Test that core module files exist."""
+    core_modules = [
+        'src/canvas_client.py',
+        'src/config.py',
+        'src/canvas_orchestrator.py',
+        'scripts/run_enhanced_scraper.py',
+        'docker/entrypoint.sh'
+    ]
+    
+    for module_path in core_modules:
+        if module_path not in project_layout:
+            raise FileNotFoundError(f"Core module missing: {module_path}")
+    
+    logger.info("Core module files exist")
+
+
+def test_configuration_handling():
+    """Test configuration file handling."""
+    yaml = pytest.importorskip("yaml")
+    
+    # Create test configuration
+    test_config = {
+        'enabled_courses': ['12345', '67890'],
+        'scraping_preferences': {
+            'file_types': ['pdf', 'pptx', 'docx'],
+            'max_file_size_mb': 50
+        },
+        'text_processing': {
+            'chunk_size': 1000,
+            'chunk_overlap': 200
+        }
+    }
+    
+    # Test YAML serialization/deserialization
+    yaml_str = yaml.dump(test_config)
+    loaded_config = yaml.safe_load(yaml_str)
+    
+    if loaded_config != test_config:
+        raise ValueError("Configuration serialization/deserialization failed")
+    
+    # Validate required fields
+    required_fields = ['enabled_courses', 'scraping_preferences']
+    for field in required_fields:
+        if field not in loaded_config:
+            raise ValueError(f"Required configuration field missing: {field}")
+    
+    logger.info("Configuration handling validation passed")
+
+
+def test_file_system_operations(session_tmp):
+    """Test file system operations."""
+    if not session_tmp.is_dir():
+        raise AssertionError("Directory creation failed")
+    
+    # Test file writing and reading back through a single handle
+    test_file = session_tmp / f"t{next(_seq)}.log"
+    test_content = f"Test log entry: entry-{next(_seq)}"
+    with open(test_file, 'w+') as fh:
+        fh.write(test_content)
+        fh.seek(0)
+        read_content = fh.read()
+    if read_content != test_content:
+        raise AssertionError("File write/read failed")
+    
+    logger.info("File system operations validation passed")
+
+
+def test_json_operations(session_tmp):
+    """Test JSON serialization operations."""
+    test_data = {
+        'timestamp': f"entry-{next(_seq)}",
+        'test_results': [
+            {'name': 'test1', 'status': 'passed'},
+            {'name': 'test2', 'status': 'failed', 'error': 'Sample error'}
+        ],
+        'metadata': {
+            'version': '2.0',
+            'platform': sys.platform
+        }
+    }
+    
+    # Test JSON serialization
+    json_str = json.dumps(test_data, indent=2)
+    loaded_data = json.loads(json_str)
+    
+    if loaded_data != test_data:
+        raise AssertionError("JSON serialization failed")
+    
+    # Test file-based JSON operations
+    with tempfile.NamedTemporaryFile('w+', suffix='.json', dir=session_tmp) as f:
+        json.dump(test_data, f)
+        f.flush()
+        f.seek(0)
+        file_loaded_data = json.load(f)
+    if file_loaded_data != test_data:
+        raise AssertionError("JSON file operations failed")
+    
+    logger.info("JSON operations validation passed")
+
+
+@functools.lru_cache(maxsize=1)
+def _subprocess_ok():
+    """Spawn the interpreter once per session to confirm exec works."""
+    return subprocess.run([sys.executable, '-c', 'pass'], stdout=subprocess.DEVNULL).returncode == 0
+
+
+def test_subprocess_operations():
+    """Test subprocess operations."""
+    if not _subprocess_ok():
+        raise AssertionError("Python subprocess execution failed")
+    if sys.version_info < (3, 8):
+        raise AssertionError("Python version check failed")
+    
+    logger.info("Subprocess operations validation passed")
+
+
+def test_entrypoint_script_syntax():
+    """Test Docker entrypoint and helper script syntax."""
+    root = _project_root()
+    entrypoint_script = root / "docker" / "entrypoint.sh"
+    
+    if not entrypoint_script.exists():
+        raise FileNotFoundError("Entrypoint script not found")
+    
+    # Syntax-check every shell script in one bash process
+    scripts = sorted(str(p) for p in (*root.glob("docker/*.sh"), *root.glob("scripts/*.sh")))
+    result = subprocess.run(
+        ['bash', '-c', 'for f in "$@"; do bash -n "$f" || exit 1; done', '--', *scripts],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    
+    if result.returncode != 0:
+        # bash -n prefixes its diagnostics with the offending script's path
+        failing = next((s for s in scripts if s in result.stderr), "shell script")
+        raise subprocess.CalledProcessError(
+            result.returncode,
+            f"bash syntax check: {failing}",
+            stderr=result.stderr
+        )
+    
+    logger.info(f"Shell script syntax validation passed ({len(scripts)} scripts)")
+
+
+def test_python_path_resolution(project_layout):
+    """Test Python path resolution for project modules."""
+    # Test that we can access the src directory
+    src_path = _project_root() / "src"
+    if "src/" not in project_layout:
+        raise AssertionError("src directory not found")
+    
+    # Test that src is in sys.path
+    if str(src_path) not in sys.path:
+        raise AssertionError("src path not in sys.path")
+    
+    # Test module discovery
+    core_files = [
+        'canvas_client.py',
+        'config.py',
+        'canvas_orchestrator.py'
+    ]
+    
+    for file_name in core_files:
+        if f"src/{file_name}" not in project_layout:
+            raise FileNotFoundError(f"Core module file missing: {file_name}")
+    
+    logger.info("Python path resolution validation passed")
+
+
+def test_import_attempts():
+    """Test import attempts for project modules (without requiring dependencies)."""
+    for module_name, description in REQUIRED_IMPORTS.items():
+        if not IMPORT_PROBES[module_name]:
+            raise ImportError(f"Failed to import required module {module_name}: not found")
+        logger.info(f"✅ Module {module_name} available ({description})")
+    
+    # Test optional imports (warnings only)
+    available_optional = []
+    for module_name, description in OPTIONAL_IMPORTS.items():
+        if IMPORT_PROBES[module_name]:
+            available_optional.append(module_name)
+            logger.info(f"✅ Optional module {module_name} available ({description})")
+        else:
+            logger.warning(f"⚠️  Optional module {module_name} not available ({description})")
+    
+    logger.info(f"Import validation passed. Optional modules available: {available_optional}")
+
+
+# Every later check depends on these; a failure aborts the run
+CRITICAL = frozenset({"Environment Setup", "Project Structure"})
+
 
 class DockerIntegrationTester:
     """Standalone Docker integration tester."""
@@ -31,322 +376,66 @@ class DockerIntegrationTester:
         self.test_results = []
         self.passed = 0
         self.failed = 0
+        self.skipped = 0
+        self.aborted = 0
     
     def run_test(self, test_name, test_func):
         """Run a single test and record results."""
-        logger.info(f"🧪 Testing: {test_name}")
+        logger.info("🧪 Testing: %s", test_name)
         try:
             test_func()
-            logger.info(f"✅ PASSED: {test_name}")
+            logger.info("✅ PASSED: %s", test_name)
             self.test_results.append({"test": test_name, "status": "PASSED", "error": None})
             self.passed += 1
             return True
+        except _Skipped as e:
+            logger.warning("⏭️  SKIPPED: %s - %s", test_name, e)
+            self.test_results.append({"test": test_name, "status": "SKIPPED", "error": str(e)})
+            self.skipped += 1
+            return True
         except Exception as e:
             error_msg = f"{type(e).__name__}: {str(e)}"
-            logger.error(f"❌ FAILED: {test_name} - {error_msg}")
+            logger.error("❌ FAILED: %s - %s", test_name, error_msg)
             self.test_results.append({"test": test_name, "status": "FAILED", "error": error_msg})
             self.failed += 1
             return False
     
-    def test_environment_setup(self):
-        """Test environment variable setup."""
-        # Set test environment variables
-        test_env = {
-            'CANVAS_API_TOKEN': 'test_token_12345',
-            'CANVAS_URL': 'https://canvas.test.edu/api/v1',
-            'SUPABASE_URL': 'https://test.supabase.co',
-            'SUPABASE_ANON_KEY': 'test_anon_key',
-            'PYTHONPATH': str(project_root)
-        }
-        
-        for key, value in test_env.items():
-            os.environ[key] = value
-        
-        # Validate required variables
-        required_vars = ['CANVAS_API_TOKEN', 'CANVAS_URL']
-        for var in required_vars:
-            if not os.environ.get(var):
-                raise ValueError(f"Missing required environment variable: {var}")
-        
-        logger.info("Environment variables configured successfully")
-    
-    def test_basic_imports(self):
-        """Test basic Python standard library imports."""
-        import json
-        import os
-        import sys
-        import tempfile
-        import subprocess
-        from pathlib import Path
-        from datetime import datetime
-        
-        # Test yaml if available
-        try:
-            import yaml
-            test_data = {"test": "value"}
-            yaml_str = yaml.dump(test_data)
-            loaded = yaml.safe_load(yaml_str)
-            assert loaded == test_data, "YAML serialization failed"
-        except ImportError:
-            logger.warning("PyYAML not available, skipping YAML tests")
-        
-        # Test requests if available
-        try:
-            import requests
-            logger.info("Requests module available")
-        except ImportError:
-            logger.warning("Requests module not available")
-        
-        logger.info("Basic imports successful")
-    
-    def test_project_structure(self):
-        """Test project directory structure."""
-        required_dirs = [
-            'src',
-            'scripts', 
-            'tests',
-            'docker',
-            'config'
-        ]
-        
-        for dir_name in required_dirs:
-            dir_path = project_root / dir_name
-            if not dir_path.exists():
-                raise FileNotFoundError(f"Required directory missing: {dir_name}")
-            if not dir_path.is_dir():
-                raise NotADirectoryError(f"Path is not a directory: {dir_name}")
-        
-        logger.info("Project structure validation passed")
-    
-    def test_core_modules_exist(self):
-        """Test that core module files exist."""
-        core_modules = [
-            'src/canvas_client.py',
-            'src/config.py',
-            'src/canvas_orchestrator.py',
-            'scripts/run_enhanced_scraper.py',
-            'docker/entrypoint.sh'
-        ]
-        
-        for module_path in core_modules:
-            file_path = project_root / module_path
-            if not file_path.exists():
-                raise FileNotFoundError(f"Core module missing: {module_path}")
-        
-        logger.info("Core module files exist")
-    
-    def test_configuration_handling(self):
-        """Test configuration file handling."""
-        try:
-            import yaml
-        except ImportError:
-            logger.warning("PyYAML not available, skipping config tests")
-            return
-        
-        # Create test configuration
-        test_config = {
-            'enabled_courses': ['12345', '67890'],
-            'scraping_preferences': {
-                'file_types': ['pdf', 'pptx', 'docx'],
-                'max_file_size_mb': 50
-            },
-            'text_processing': {
-                'chunk_size': 1000,
-                'chunk_overlap': 200
-            }
-        }
-        
-        # Test YAML serialization/deserialization
-        yaml_str = yaml.dump(test_config)
-        loaded_config = yaml.safe_load(yaml_str)
-        
-        if loaded_config != test_config:
-            raise ValueError("Configuration serialization/deserialization failed")
-        
-        # Validate required fields
-        required_fields = ['enabled_courses', 'scraping_preferences']
-        for field in required_fields:
-            if field not in loaded_config:
-                raise ValueError(f"Required configuration field missing: {field}")
-        
-        logger.info("Configuration handling validation passed")
-    
-    def test_file_system_operations(self):
-        """Test file system operations."""
-        # Test temporary directory creation
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Test directory creation
-            test_dir = temp_path / "test_logs"
-            test_dir.mkdir()
-            assert test_dir.exists(), "Directory creation failed"
-            
-            # Test file writing
-            test_file = test_dir / "test.log"
-            test_content = f"Test log entry: {datetime.now().isoformat()}"
-            test_file.write_text(test_content)
-            
-            # Test file reading
-            read_content = test_file.read_text()
-            assert read_content == test_content, "File write/read failed"
-        
-        logger.info("File system operations validation passed")
-    
-    def test_json_operations(self):
-        """Test JSON serialization operations."""
-        test_data = {
-            'timestamp': datetime.now().isoformat(),
-            'test_results': [
-                {'name': 'test1', 'status': 'passed'},
-                {'name': 'test2', 'status': 'failed', 'error': 'Sample error'}
-            ],
-            'metadata': {
-                'version': '2.0',
-                'platform': sys.platform
-            }
-        }
-        
-        # Test JSON serialization
-        json_str = json.dumps(test_data, indent=2)
-        loaded_data = json.loads(json_str)
-        
-        assert loaded_data == test_data, "JSON serialization failed"
-        
-        # Test file-based JSON operations
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(test_data, f)
-            temp_file = f.name
-        
-        try:
-            with open(temp_file, 'r') as f:
-                file_loaded_data = json.load(f)
-            assert file_loaded_data == test_data, "JSON file operations failed"
-        finally:
-            os.unlink(temp_file)
-        
-        logger.info("JSON operations validation passed")
-    
-    def test_subprocess_operations(self):
-        """Test subprocess operations."""
-        # Test basic command execution
-        result = subprocess.run(['echo', 'test'], capture_output=True, text=True)
-        assert result.returncode == 0, "Basic subprocess execution failed"
-        assert 'test' in result.stdout, "Subprocess output validation failed"
-        
-        # Test Python execution
-        result = subprocess.run([
-            sys.executable, '-c', 
-            'import sys; print(f"Python {sys.version_info.major}.{sys.version_info.minor}")'
-        ], capture_output=True, text=True)
-        assert result.returncode == 0, "Python subprocess execution failed"
-        assert 'Python' in result.stdout, "Python version check failed"
-        
-        logger.info("Subprocess operations validation passed")
-    
-    def test_entrypoint_script_syntax(self):
-        """Test Docker entrypoint script syntax."""
-        entrypoint_script = project_root / "docker" / "entrypoint.sh"
-        
-        if not entrypoint_script.exists():
-            raise FileNotFoundError("Entrypoint script not found")
-        
-        # Test bash syntax
-        result = subprocess.run(
-            ['bash', '-n', str(entrypoint_script)],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode != 0:
-            raise subprocess.CalledProcessError(
-                result.returncode,
-                "bash syntax check",
-                stderr=result.stderr
-            )
-        
-        logger.info("Entrypoint script syntax validation passed")
-    
-    def test_python_path_resolution(self):
-        """Test Python path resolution for project modules."""
-        # Test that we can access the src directory
-        src_path = project_root / "src"
-        assert src_path.exists(), "src directory not found"
-        
-        # Test that src is in sys.path
-        assert str(src_path) in sys.path, "src path not in sys.path"
-        
-        # Test module discovery
-        core_files = [
-            'canvas_client.py',
-            'config.py',
-            'canvas_orchestrator.py'
-        ]
-        
-        for file_name in core_files:
-            module_file = src_path / file_name
-            if not module_file.exists():
-                raise FileNotFoundError(f"Core module file missing: {file_name}")
-        
-        logger.info("Python path resolution validation passed")
-    
-    def test_import_attempts(self):
-        """Test import attempts for project modules (without requiring dependencies)."""
-        import_attempts = [
-            ('json', 'standard library'),
-            ('os', 'standard library'),
-            ('sys', 'standard library'),
-            ('pathlib', 'standard library'),
-            ('tempfile', 'standard library'),
-            ('subprocess', 'standard library'),
-        ]
-        
-        # Test optional imports
-        optional_imports = [
-            ('yaml', 'PyYAML'),
-            ('requests', 'requests library'),
-        ]
-        
-        for module_name, description in import_attempts:
-            try:
-                __import__(module_name)
-                logger.info(f"✅ Successfully imported {module_name} ({description})")
-            except ImportError as e:
-                raise ImportError(f"Failed to import required module {module_name}: {e}")
-        
-        # Test optional imports (warnings only)
-        available_optional = []
-        for module_name, description in optional_imports:
-            try:
-                __import__(module_name)
-                available_optional.append(module_name)
-                logger.info(f"✅ Optional module {module_name} available ({description})")
-            except ImportError:
-                logger.warning(f"⚠️  Optional module {module_name} not available ({description})")
-        
-        logger.info(f"Import validation passed. Optional modules available: {available_optional}")
-    
     def run_all_tests(self):
         """Run all tests and generate summary."""
         logger.info("🚀 Starting Standalone Docker Integration Tests")
         logger.info("=" * 60)
         
+        # Scratch space for the I/O checks, removed once the run finishes
+        scratch = tempfile.TemporaryDirectory()
+        session_tmp = Path(scratch.name)
+        
         tests = [
-            ("Environment Setup", self.test_environment_setup),
-            ("Basic Imports", self.test_basic_imports),
-            ("Project Structure", self.test_project_structure),
-            ("Core Modules Exist", self.test_core_modules_exist),
-            ("Configuration Handling", self.test_configuration_handling),
-            ("File System Operations", self.test_file_system_operations),
-            ("JSON Operations", self.test_json_operations),
-            ("Subprocess Operations", self.test_subprocess_operations),
-            ("Entrypoint Script Syntax", self.test_entrypoint_script_syntax),
-            ("Python Path Resolution", self.test_python_path_resolution),
-            ("Import Attempts", self.test_import_attempts),
+            ("Environment Setup", test_environment_setup),
+            ("Basic Imports", test_basic_imports),
+            ("Project Structure", lambda: test_project_structure(_project_layout())),
+            ("Core Modules Exist", lambda: test_core_modules_exist(_project_layout())),
+            ("Configuration Handling", test_configuration_handling),
+            ("File System Operations", lambda: test_file_system_operations(session_tmp)),
+            ("JSON Operations", lambda: test_json_operations(session_tmp)),
+            ("Subprocess Operations", test_subprocess_operations),
+            ("Entrypoint Script Syntax", test_entrypoint_script_syntax),
+            ("Python Path Resolution", lambda: test_python_path_resolution(_project_layout())),
+            ("Import Attempts", test_import_attempts),
         ]
         
-        for test_name, test_func in tests:
-            self.run_test(test_name, test_func)
+        with scratch:
+            for index, (test_name, test_func) in enumerate(tests):
+                if not self.run_test(test_name, test_func) and test_name in CRITICAL:
+                    logger.error("Aborting: critical test failed (%s)", test_name)
+                    # Record the checks that never ran so a partial run doesn't look complete
+                    for remaining_name, _ in tests[index + 1:]:
+                        self.test_results.append({
+                            "test": remaining_name,
+                            "status": "SKIPPED (ABORTED)",
+                            "error": f"Not run: critical test failed ({test_name})"
+                        })
+                        self.aborted += 1
+                    break
         
         # Generate summary
         logger.info("=" * 60)
@@ -355,6 +444,9 @@ class DockerIntegrationTester:
         logger.info(f"Total Tests: {len(tests)}")
         logger.info(f"Passed: {self.passed}")
         logger.info(f"Failed: {self.failed}")
+        logger.info(f"Skipped: {self.skipped}")
+        if self.aborted:
+            logger.warning(f"Skipped (aborted): {self.aborted}")
         logger.info(f"Success Rate: {(self.passed/len(tests)*100):.1f}%")
         
         if self.failed == 0:
@@ -374,19 +466,25 @@ class DockerIntegrationTester:
             'total_tests': len(tests),
             'passed': self.passed,
             'failed': self.failed,
+            'skipped': self.skipped,
+            'aborted': self.aborted,
             'success_rate': self.passed/len(tests)*100,
             'overall_success': success,
             'detailed_results': self.test_results
         }
         
-        results_file = project_root / "standalone_test_results.json"
-        with open(results_file, 'w') as f:
-            json.dump(results_summary, f, indent=2)
+        results_file = _project_root() / "standalone_test_results.json"
+        # orjson emits bytes directly when installed; stdlib output matches its compact form
+        try:
+            import orjson
+            payload = orjson.dumps(results_summary)
+        except ImportError:
+            payload = json.dumps(results_summary, separators=(',', ':')).encode()
+        results_file.write_bytes(payload)
         
         logger.info(f"📄 Detailed results saved to: {results_file}")
         return success
 
-
 def main():
     """Main execution function."""
     tester = DockerIntegrationTester()